@@ -4,6 +4,7 @@ Card Deck Package
 A package for creating and managing immutable playing card decks.
 """
 
-from .deck import Card, Deck
+from ._card import RANKS, SUITS, Card
+from .deck import Deck
 
-__all__ = ['Card', 'Deck']
\ No newline at end of file
+__all__ = ["RANKS", "SUITS", "Card", "Deck"]
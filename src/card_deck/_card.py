@@ -0,0 +1,75 @@
+import sys
+from itertools import product
+from typing import ClassVar
+
+SUITS: tuple[str, ...] = tuple(
+    sys.intern(suit) for suit in ("Spades", "Hearts", "Diamonds", "Clubs")
+)
+RANKS: tuple[str, ...] = tuple(
+    sys.intern(rank)
+    for rank in ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+)
+
+
+class Card(int):
+    """
+    An immutable playing card with rank and suit.
+
+    Represents a single playing card that cannot be modified after creation.
+    Each card is encoded as its integer position in a standard deck
+    (suit index * 13 + rank index, 0-51), so hashing and equality run as
+    C-level integer operations. Rank and suit are read-only properties looked
+    up from the RANKS and SUITS tables. Cards are interned: constructing the
+    same rank and suit twice returns the same shared instance.
+
+    Apart from truthiness (every card is truthy), a card keeps its int
+    behaviour: it compares and hashes equal to its code, so Card("A", "Spades")
+    == 0 and the two collide as dict keys; cards order by deck position
+    (all Spades before Hearts, then Diamonds, then Clubs; A low within a suit);
+    and arithmetic on a card returns a plain int.
+
+    Args:
+        rank: The card rank (A, 2-10, J, Q, K)
+        suit: The card suit (Spades, Hearts, Diamonds, Clubs)
+
+    Raises:
+        ValueError: If rank or suit is not part of a standard deck
+    """
+
+    __slots__ = ()
+
+    _pool: ClassVar[dict[tuple[str, str], "Card"]] = {}
+
+    def __new__(cls, rank: str, suit: str) -> "Card":
+        try:
+            return cls._pool[(rank, suit)]
+        except KeyError:
+            raise ValueError(f"invalid card: rank={rank!r}, suit={suit!r}") from None
+
+    @property
+    def rank(self) -> str:
+        return RANKS[self % 13]
+
+    @property
+    def suit(self) -> str:
+        return SUITS[self // 13]
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        return f"Card(rank={self.rank!r}, suit={self.suit!r})"
+
+    def __reduce__(self) -> tuple[type["Card"], tuple[str, str]]:
+        return (Card, (self.rank, self.suit))
+
+
+# All 52 cards in standard deck order, each encoded as its position
+STANDARD_CARDS: tuple[Card, ...] = tuple(
+    int.__new__(Card, code) for code in range(len(SUITS) * len(RANKS))
+)
+
+Card._pool.update(
+    ((rank, suit), card)
+    for card, (suit, rank) in zip(STANDARD_CARDS, product(SUITS, RANKS))
+)
@@ -1,23 +1,11 @@
-from typing import List, NamedTuple
+from collections.abc import Iterator
+from typing import ClassVar
 
+from ._card import STANDARD_CARDS, Card
 
-class Card(NamedTuple):
-    """
-    An immutable playing card with rank and suit.
-
-    Represents a single playing card that cannot be modified after creation.
-    Uses NamedTuple for natural immutability with modern type hints.
-
-    Args:
-        rank: The card rank (A, 2-10, J, Q, K)
-        suit: The card suit (Spades, Hearts, Diamonds, Clubs)
-    """
-
-    rank: str
-    suit: str
-
-    def __setattr__(self, name: str, value: object) -> None:
-        raise AttributeError(f"can't set attribute '{name}'")
+_CARD_KEYS: frozenset[tuple[str, str]] = frozenset(
+    (card.rank, card.suit) for card in STANDARD_CARDS
+)
 
 
 class Deck:
@@ -26,14 +14,16 @@ class Deck:
 
     Represents a complete deck of playing cards with all standard suits and ranks.
     Each deck contains exactly 52 unique cards (13 ranks × 4 suits).
-    Cards are immutable and the deck provides defensive copies to maintain integrity.
+    Cards are immutable and the deck exposes them as an immutable tuple, so the
+    deck's contents cannot be changed through the cards property. Because every
+    standard deck is identical, Deck() always returns the same shared instance.
 
     The deck is initialized with all standard playing cards:
     - Suits: Spades, Hearts, Diamonds, Clubs
     - Ranks: A, 2, 3, 4, 5, 6, 7, 8, 9, 10, J, Q, K
 
     Attributes:
-        cards: A defensive copy of the deck's cards as a List[Card]
+        cards: The deck's cards as an immutable tuple[Card, ...]
 
     Example:
         >>> deck = Deck()
@@ -45,18 +35,81 @@ class Deck:
         'Spades'
     """
 
-    def __init__(self) -> None:
-        self._cards: List[Card] = []
-        suits = ["Spades", "Hearts", "Diamonds", "Clubs"]
-        ranks = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+    __slots__ = ("_cards",)
+
+    _singleton: ClassVar["Deck | None"] = None
 
-        for suit in suits:
-            for rank in ranks:
-                self._cards.append(Card(rank, suit))
+    _cards: tuple[Card, ...]
+
+    def __new__(cls) -> "Deck":
+        instance = cls.__dict__.get("_singleton")
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._cards = STANDARD_CARDS
+            cls._singleton = instance
+        return instance
 
     @property
-    def cards(self) -> List[Card]:
-        return self._cards[:]  # Return a copy
+    def cards(self) -> tuple[Card, ...]:
+        """
+        The deck's cards in standard order.
+
+        The tuple is shared rather than copied on each access; call list() on it
+        or use cards_copy() when a mutable sequence is needed.
+
+        Returns:
+            An immutable tuple[Card, ...] of all cards in the deck.
+        """
+        return self._cards
+
+    def cards_copy(self) -> list[Card]:
+        """
+        Return a mutable copy of the deck's cards.
+
+        Returns:
+            A new list[Card] that can be modified without affecting the deck.
+        """
+        return list(self._cards)
+
+    def contains(self, rank: str, suit: str) -> bool:
+        """
+        Check whether the deck holds the card with the given rank and suit.
+
+        Args:
+            rank: The card rank (A, 2-10, J, Q, K)
+            suit: The card suit (Spades, Hearts, Diamonds, Clubs)
+
+        Returns:
+            True if the card is in the deck, False otherwise.
+        """
+        return (rank, suit) in self
+
+    def __contains__(self, item: object) -> bool:
+        """
+        Check whether an item names a card in the deck.
+
+        An item is in the deck if it is a Card or a (rank, suit) pair of a
+        card in the deck. Anything else, including plain ints that compare
+        equal to a Card's code, is not a member. This differs from membership
+        in the deck.cards tuple, which uses the tuple's own equality rules.
+
+        Args:
+            item: A Card or a (rank, suit) pair
+
+        Returns:
+            True if the item names a card in the deck, False otherwise.
+        """
+        if isinstance(item, Card):
+            return True
+        if isinstance(item, tuple):
+            try:
+                return item in _CARD_KEYS
+            except TypeError:
+                return False
+        return False
+
+    def __iter__(self) -> Iterator[Card]:
+        return iter(self._cards)
 
     def __len__(self) -> int:
         return len(self._cards)
@@ -64,3 +117,6 @@ class Deck:
     def __str__(self) -> str:
         return f"Deck with {len(self._cards)} cards"
 
+    def __reduce__(self) -> tuple[type["Deck"], tuple[()]]:
+        return (Deck, ())
+
@@ -8,6 +8,8 @@ This test suite covers deck creation and initialization for a standard 52-card d
 - Edge cases in deck initialization
 """
 
+import copy
+import pickle
 import sys
 from typing import List, Set, Tuple
 
@@ -55,7 +57,7 @@ class TestDeckContent:
         Validates that deck generation includes all required suits.
         """
         deck: Deck = Deck()
-        cards: List[Card] = deck.cards
+        cards: tuple[Card, ...] = deck.cards
         suits: Set[str] = set(card.suit for card in cards)
         expected_suits: Set[str] = {"Spades", "Hearts", "Diamonds", "Clubs"}
         assert suits == expected_suits
@@ -66,7 +68,7 @@ class TestDeckContent:
         Validates that deck generation includes all required ranks.
         """
         deck: Deck = Deck()
-        cards: List[Card] = deck.cards
+        cards: tuple[Card, ...] = deck.cards
         ranks: Set[str] = set(card.rank for card in cards)
         expected_ranks: Set[str] = {
             "A",
@@ -91,7 +93,7 @@ class TestDeckContent:
         Validates proper distribution of cards across suits.
         """
         deck: Deck = Deck()
-        cards: List[Card] = deck.cards
+        cards: tuple[Card, ...] = deck.cards
         suits: List[str] = ["Spades", "Hearts", "Diamonds", "Clubs"]
 
         for suit in suits:
@@ -104,7 +106,7 @@ class TestDeckContent:
         Validates proper distribution of cards across ranks.
         """
         deck: Deck = Deck()
-        cards: List[Card] = deck.cards
+        cards: tuple[Card, ...] = deck.cards
         ranks: List[str] = [
             "A",
             "2",
@@ -131,20 +133,20 @@ class TestDeckContent:
         Validates that no duplicate cards exist.
         """
         deck: Deck = Deck()
-        cards: List[Card] = deck.cards
+        cards: tuple[Card, ...] = deck.cards
         card_combinations: Set[Tuple[str, str]] = set(
             (card.rank, card.suit) for card in cards
         )
         assert len(card_combinations) == 52
 
-    def test_deck_cards_property_returns_list_of_cards(self) -> None:
+    def test_deck_cards_property_returns_tuple_of_cards(self) -> None:
         """
-        Test that the cards property returns a list containing Card objects.
+        Test that the cards property returns a tuple containing Card objects.
         Validates proper card object creation and storage.
         """
         deck: Deck = Deck()
-        cards: List[Card] = deck.cards
-        assert isinstance(cards, list)
+        cards: tuple[Card, ...] = deck.cards
+        assert isinstance(cards, tuple)
         assert len(cards) == 52
 
         card: Card
@@ -189,6 +191,25 @@ class TestDeckInitializationEdgeCases:
         with pytest.raises(TypeError):
             Deck(52, "standard")  # type: ignore
 
+    def test_standard_deck_is_a_shared_instance(self) -> None:
+        """
+        Test that creating a standard deck twice returns the same instance.
+        Validates that identical immutable decks are shared rather than rebuilt.
+        """
+        assert Deck() is Deck()
+
+    def test_shared_deck_cannot_gain_attributes(self) -> None:
+        """
+        Test that new attributes cannot be added to the shared deck instance.
+        Validates that state cannot leak between callers through the singleton.
+        """
+        deck: Deck = Deck()
+
+        with pytest.raises(AttributeError):
+            deck.extra = 1  # type: ignore
+
+        assert not hasattr(Deck(), "extra")
+
     def test_deck_creation_is_repeatable(self) -> None:
         """
         Test that deck creation can be performed multiple times without issues.
@@ -200,7 +221,7 @@ class TestDeckInitializationEdgeCases:
             decks.append(deck)
             assert len(deck) == 52
 
-        # All decks should be valid and independent
+        # All decks should be valid (they are the same shared instance)
         assert len(decks) == 10
         deck: Deck
         for deck in decks:
@@ -278,6 +299,23 @@ class TestCardObjectValidation:
         assert ("10", "Spades") in card_tuples  # Ten of Spades
         assert ("2", "Hearts") in card_tuples  # Two of Hearts
 
+    def test_deck_membership_checks_rank_and_suit_pairs(self) -> None:
+        """
+        Test that deck membership can be checked by (rank, suit) pair or Card.
+        Validates the contains() method and __contains__ implementation.
+        """
+        deck: Deck = Deck()
+
+        assert deck.contains("A", "Spades")
+        assert not deck.contains("Ace", "Spades")
+        assert ("K", "Hearts") in deck
+        assert ("K", "Stars") not in deck
+        assert Card("Q", "Diamonds") in deck
+        assert "A" not in deck
+        assert 0 not in deck
+        assert (["A"], "Spades") not in deck
+        assert not deck.contains(["A"], "Spades")  # type: ignore
+
 
 class TestCardImmutability:
     """Test that individual cards in the deck are immutable."""
@@ -331,12 +369,12 @@ class TestCardImmutability:
 
     def test_modifying_cards_list_does_not_affect_original_deck(self) -> None:
         """
-        Test that modifying the cards list returned by deck.cards doesn't affect the deck.
-        Validates that deck.cards returns a copy, not a reference.
+        Test that modifying the list returned by deck.cards_copy() doesn't affect the deck.
+        Validates that deck.cards_copy() returns a copy, not a reference.
         """
         deck: Deck = Deck()
         original_length: int = len(deck)
-        cards_copy: List[Card] = deck.cards
+        cards_copy: List[Card] = deck.cards_copy()
 
         # Modify the copy
         cards_copy.pop()
@@ -346,6 +384,22 @@ class TestCardImmutability:
         assert len(deck) == original_length
         assert len(deck.cards) == 52
 
+    def test_deck_cards_cannot_be_modified_through_property(self) -> None:
+        """
+        Test that the cards exposed by deck.cards cannot be mutated in place.
+        Validates that deck.cards is an immutable view of the deck.
+        """
+        deck: Deck = Deck()
+
+        with pytest.raises(AttributeError):
+            deck.cards.pop()  # type: ignore
+
+        cards: List[Card] = list(deck.cards)
+        cards.pop()
+
+        assert len(cards) == 51
+        assert len(deck.cards) == 52
+
     def test_cards_maintain_immutability_across_deck_operations(self) -> None:
         """
         Test that cards remain immutable even when accessed through different deck instances.
@@ -380,6 +434,26 @@ class TestCardImmutability:
         with pytest.raises(AttributeError):
             setattr(card, "suit", "Modified")
 
+    def test_copied_card_is_the_original_card(self) -> None:
+        """
+        Test that shallow and deep copies of a card return the same instance.
+        Validates that immutable cards survive the copy protocol unchanged.
+        """
+        card: Card = Card("A", "Spades")
+        assert copy.copy(card) is card
+        assert copy.deepcopy(card) is card
+
+    def test_pickled_card_round_trips_to_the_original_card(self) -> None:
+        """
+        Test that pickling and unpickling a card returns the same instance.
+        Validates that immutable cards can be serialized and restored.
+        """
+        card: Card = Card("K", "Hearts")
+        restored: Card = pickle.loads(pickle.dumps(card))
+        assert restored is card
+        assert restored.rank == "K"
+        assert restored.suit == "Hearts"
+
     def test_card_equality_works_with_immutable_cards(self) -> None:
         """
         Test that card equality comparison works correctly with immutable cards.
@@ -408,8 +482,100 @@ class TestCardImmutability:
         # Cards with same rank and suit should be equal
         assert ace_spades_1 == ace_spades_2
 
-        # But they should be different object instances
-        assert ace_spades_1 is not ace_spades_2
+        # Immutable cards are safely shared between decks
+        assert ace_spades_1 is ace_spades_2
+
+    def test_card_attributes_cannot_be_deleted(self) -> None:
+        """
+        Test that card attributes cannot be deleted after creation.
+        Validates that immutability also covers attribute deletion.
+        """
+        card: Card = Card("A", "Spades")
+
+        with pytest.raises(AttributeError):
+            del card.rank  # type: ignore
+
+        assert card.rank == "A"
+
+    def test_equal_cards_have_equal_hashes(self) -> None:
+        """
+        Test that cards with the same rank and suit hash identically.
+        Validates that cards behave correctly as set members and dict keys.
+        """
+        card1: Card = Card("K", "Hearts")
+        card2: Card = Card("K", "Hearts")
+
+        assert card1 == card2
+        assert hash(card1) == hash(card2)
+        assert len({card1, card2}) == 1
+        assert card1 != Card("K", "Clubs")
+
+    def test_identical_cards_share_one_instance(self) -> None:
+        """
+        Test that constructing the same card twice returns the same object.
+        Validates that cards are interned as shared flyweights.
+        """
+        assert Card("A", "Spades") is Card("A", "Spades")
+        assert Card(suit="Hearts", rank="Q") is Card("Q", "Hearts")
+        assert Card("A", "Spades") is not Card("A", "Hearts")
+
+    def test_card_strings_are_interned(self) -> None:
+        """
+        Test that a card's rank and suit are interned strings.
+        Validates that dynamically built strings resolve to the shared card.
+        """
+        suit: str = "".join(["Hea", "rts"])
+        card: Card = Card("7", suit)
+
+        assert card.suit is sys.intern("Hearts")
+        assert card is Card("7", "Hearts")
+
+    def test_every_card_is_truthy(self) -> None:
+        """
+        Test that every card is truthy, including the one encoded as 0.
+        Validates that `if card:` checks never drop the Ace of Spades.
+        """
+        assert bool(Card("A", "Spades"))
+        assert all(Deck().cards)
+
+    def test_cards_order_by_deck_position(self) -> None:
+        """
+        Test that cards compare in standard deck order.
+        Validates that ordering follows suit first, then rank.
+        """
+        assert Card("A", "Spades") < Card("2", "Spades")
+        assert Card("K", "Spades") < Card("A", "Hearts")
+        assert sorted(reversed(Deck().cards)) == list(Deck().cards)
+
+    def test_card_is_encoded_as_its_deck_position(self) -> None:
+        """
+        Test that each card is encoded as its integer position in a standard deck.
+        Validates the compact suit-major 0-51 card encoding.
+        """
+        assert Card("A", "Spades") == 0
+        assert Card("K", "Spades") == 12
+        assert Card("A", "Hearts") == 13
+        assert Card("K", "Clubs") == 51
+        assert list(Deck().cards) == list(range(52))
+
+    def test_card_creation_with_unknown_rank_or_suit_raises_error(self) -> None:
+        """
+        Test that creating a card outside the standard deck raises ValueError.
+        Validates that only the 52 standard cards can be represented.
+        """
+        with pytest.raises(ValueError):
+            Card("Ace", "Hearts")
+
+        with pytest.raises(ValueError):
+            Card("A", "Stars")
+
+    def test_card_repr_shows_rank_and_suit(self) -> None:
+        """
+        Test that a card's repr includes its rank and suit.
+        Validates readable debugging output for card objects.
+        """
+        card: Card = Card("10", "Diamonds")
+        assert repr(card) == "Card(rank='10', suit='Diamonds')"
 
 
 class TestDeckProperties:
@@ -422,8 +588,8 @@ class TestDeckProperties:
         """
         deck: Deck = Deck()
         assert hasattr(deck, "cards")
-        cards: List[Card] = deck.cards
-        assert isinstance(cards, list)
+        cards: tuple[Card, ...] = deck.cards
+        assert isinstance(cards, tuple)
 
     def test_deck_supports_len_function(self) -> None:
         """
@@ -435,6 +601,15 @@ class TestDeckProperties:
         assert length == 52
         assert isinstance(length, int)
 
+    def test_deck_supports_iteration_over_cards(self) -> None:
+        """
+        Test that iterating a deck yields its cards in order.
+        Validates __iter__ method implementation.
+        """
+        deck: Deck = Deck()
+        iterated: List[Card] = [card for card in deck]
+        assert iterated == list(deck.cards)
+
     def test_deck_string_representation_is_meaningful(self) -> None:
         """
         Test that deck has a meaningful string representation.
@@ -480,7 +655,7 @@ class TestDeckCreationConsistency:
     def test_deck_creation_does_not_modify_global_state(self) -> None:
         """
         Test that creating a deck doesn't affect subsequent deck creations.
-        Validates that deck creation is stateless and independent.
+        Validates that deck creation is stateless and repeatable.
         """
         deck1: Deck = Deck()
         first_deck_length: int = len(deck1)
@@ -488,6 +663,27 @@ class TestDeckCreationConsistency:
         deck2: Deck = Deck()
         second_deck_length: int = len(deck2)
 
-        # Both decks should be identical and unaffected by each other
+        # Both decks should be identical and unchanged by repeated creation
         assert first_deck_length == second_deck_length == 52
         assert len(deck1) == 52  # First deck unchanged
+
+    def test_deep_copied_deck_still_has_52_cards(self) -> None:
+        """
+        Test that deep-copying a deck produces a complete standard deck.
+        Validates that decks and their cards support the copy protocol.
+        """
+        original_cards: tuple[Card, ...] = Deck().cards
+        deck: Deck = copy.deepcopy(Deck())
+        assert len(deck) == 52
+        assert deck is Deck()
+        assert Deck().cards is original_cards
+
+    def test_unpickled_deck_does_not_replace_shared_cards(self) -> None:
+        """
+        Test that unpickling a deck returns the shared deck unchanged.
+        Validates that loading pickled data cannot alter process-wide state.
+        """
+        original_cards: tuple[Card, ...] = Deck().cards
+        deck: Deck = pickle.loads(pickle.dumps(Deck()))
+        assert deck is Deck()
+        assert Deck().cards is original_cards